@@ -0,0 +1,374 @@
+import streamlit as st
+from math import sqrt, pi
+
+# --- Constants ---
+C_MU = 0.09  # Standard k-epsilon model constant
+_C_MU_INV_QUARTER = C_MU ** -0.25  # Precomputed for the omega relation
+_PI_OVER_4 = pi * 0.25  # Circular area factor
+
+# --- Static Option Tables ---
+# Lookup tables for the selectboxes, shared by the module-level format functions.
+_MODEL_OPTIONS = {1: "Spalart-Allmaras", 2: "k-epsilon based", 3: "k-omega based"}
+_MODEL_KEYS = tuple(_MODEL_OPTIONS)
+
+_APP_OPTIONS = {
+    1: "Wall bounded flow (Pipe / Channel)",
+    2: "Inlet into a domain (e.g., Jet)",
+    3: "External aerodynamics (e.g., Airfoil)",
+    4: "High speed flows inside complex geometries",
+    5: "Flow inside pumps or compressors",
+    6: "Unsure / General case"
+}
+_APP_KEYS = tuple(_APP_OPTIONS)
+
+_CROSS_SEC_OPTIONS = {
+    1: "Circular", 2: "Annular", 3: "Square", 4: "Rectangular",
+    5: "2D Channel", 6: "Other (Area/Perimeter)", 7: "Specified Hydraulic Diameter"
+}
+_CROSS_SEC_KEYS = tuple(_CROSS_SEC_OPTIONS)
+
+_VEL_TYPE_OPTIONS = {1: "Velocity", 2: "Mass Flow Rate", 3: "Volume Flow Rate"}
+_VEL_TYPE_KEYS = tuple(_VEL_TYPE_OPTIONS)
+
+_L_CHOICE_OPTIONS = {
+    1: "Cross-section based (Standard)",
+    2: "Boundary Layer Thickness",
+    3: "Characteristic Length (e.g., perforations)"
+}
+_L_CHOICE_KEYS = tuple(_L_CHOICE_OPTIONS)
+
+
+# Module-level format functions keep widget identity stable across reruns.
+def _fmt_model(x):
+    return _MODEL_OPTIONS[x]
+
+
+def _fmt_app(x):
+    return _APP_OPTIONS[x]
+
+
+def _fmt_cross_sec(x):
+    return _CROSS_SEC_OPTIONS[x]
+
+
+def _fmt_vel_type(x):
+    return _VEL_TYPE_OPTIONS[x]
+
+
+def _fmt_l_choice(x):
+    return _L_CHOICE_OPTIONS[x]
+
+
+# Selector callback: a new model, application or input layout needs a fresh
+# submit before results are shown again.
+def _clear_calc_ready():
+    st.session_state.pop("calc_ready", None)
+
+
+# --- Core Calculation ---
+@st.cache_data(max_entries=128)
+def compute_turbulence(rho, mu, U, Dh, l, I, visc_rat, model_choice, app_choice):
+    """
+    Computes the turbulence properties and reference Dirichlet values
+    (k, omega, epsilon, nuTilda) from the inlet specification.
+    Pure function of its inputs, so results are memoized across reruns.
+    """
+    Re, k, omega, epsilon, mut = (None,) * 5
+    if app_choice in [1, 2]: # Internal flows
+        Re = rho * U * Dh / mu
+        I = 0.16 * (Re ** -0.125)
+        k = 1.5 * (U * I)**2
+        if k > 0 and l > 0:
+            omega = _C_MU_INV_QUARTER * sqrt(k) / l
+            epsilon = C_MU * k * omega
+            mut = rho * k / omega
+            visc_rat = mut / mu
+        else:
+            visc_rat = 1.0 # Default fallback
+    elif U is not None: # External flows with a reference velocity
+        k = 1.5 * (U * I)**2
+        mut = visc_rat * mu
+        omega = rho * k / mut if mut > 0 else float('inf')
+        epsilon = C_MU * k * omega
+    nuTilda = visc_rat * mu / rho
+    return {
+        "Re": Re, "I": I, "k": k, "omega": omega, "epsilon": epsilon,
+        "nuTilda": nuTilda, "visc_rat": visc_rat, "mut": mut,
+    }
+
+
+# --- Sidebar for Core Inputs ---
+def render_sidebar():
+    """
+    Renders the core setup and fluid property inputs in the sidebar.
+    Returns (model_choice, app_choice, rho, mu).
+    """
+    with st.sidebar:
+        st.header("1. Core Setup")
+
+        model_choice = st.selectbox(
+            "Select the turbulence model:",
+            options=_MODEL_KEYS,
+            format_func=_fmt_model,
+            key="sidebar_model",
+            on_change=_clear_calc_ready
+        )
+
+        app_choice = st.selectbox(
+            "Choose the application type:",
+            options=_APP_KEYS,
+            format_func=_fmt_app,
+            key="sidebar_app",
+            on_change=_clear_calc_ready
+        )
+
+        st.header("2. Fluid Properties")
+        rho = st.number_input("Density (ρ) in kg/m³", min_value=1e-12, value=1.225, format="%g", step=None, key="fluid_rho")
+        mu = st.number_input("Dynamic Viscosity (μ) in Pa-s", min_value=1e-12, value=1.81e-5, format="%g", step=None, key="fluid_mu")
+
+    return model_choice, app_choice, rho, mu
+
+
+# --- Main Panel for Detailed Inputs ---
+def render_inputs(app_choice, model_choice, rho):
+    """
+    Renders the inlet and flow specification for the chosen application.
+    Returns (Dh, U, l, I, visc_rat, submitted).
+    """
+    # Initialize variables
+    Dh, A, U, l, I, visc_rat = (None,) * 6
+    submitted = False
+
+    # --- Case 1: Internal Flows (Requires detailed geometry and velocity) ---
+    if app_choice in [1, 2]:
+        st.header("3. Inlet & Flow Specification")
+        # Selectors stay outside the form so changing them reruns the script
+        # and shows the matching input fields straight away.
+        sel_col1, sel_col2 = st.columns(2)
+        with sel_col1:
+            st.subheader("Inlet Geometry")
+            cross_sec_choice = st.selectbox(
+                "Inlet Cross-Section:",
+                options=_CROSS_SEC_KEYS,
+                format_func=_fmt_cross_sec,
+                key="geom_cross_sec",
+                on_change=_clear_calc_ready
+            )
+        is_2d_channel = cross_sec_choice == 5
+
+        with sel_col2:
+            st.subheader("Flow Rate / Velocity")
+            if is_2d_channel:
+                st.info("For a 2D channel, only velocity can be specified.")
+            else:
+                vel_type_choice = st.selectbox(
+                    "Boundary Condition Type:",
+                    options=_VEL_TYPE_KEYS,
+                    format_func=_fmt_vel_type,
+                    key="vel_type",
+                    on_change=_clear_calc_ready
+                )
+
+        st.subheader("Turbulence Generation")
+        l_choice = st.selectbox(
+            "Primary source of turbulence:",
+            options=_L_CHOICE_KEYS,
+            format_func=_fmt_l_choice,
+            key="turb_l_choice",
+            on_change=_clear_calc_ready
+        )
+        if l_choice == 2:
+            delta_choice = st.radio(
+                "Boundary layer thickness (δ):",
+                ["Estimate for fully developed flow", "Specify a value"],
+                horizontal=True,
+                key="turb_delta_choice",
+                on_change=_clear_calc_ready
+            )
+
+        with st.form("inlet_form", clear_on_submit=False):
+            col1, col2 = st.columns(2)
+
+            with col1:
+                # Conditional Geometry Inputs
+                if cross_sec_choice == 1: # Circular
+                    diam = st.number_input("Diameter (m)", min_value=1e-12, value=1.0, format="%g", step=None, key="geom_diam")
+                elif cross_sec_choice == 2: # Annular
+                    Din = st.number_input("Inner Diameter (m)", min_value=1e-12, value=0.5, format="%g", step=None, key="geom_din")
+                    Dout = st.number_input("Outer Diameter (m)", min_value=1e-12, value=1.0, format="%g", step=None, key="geom_dout")
+                elif cross_sec_choice == 3: # Square
+                    side = st.number_input("Side Length (m)", min_value=1e-12, value=1.0, format="%g", step=None, key="geom_side")
+                elif cross_sec_choice == 4: # Rectangular
+                    a = st.number_input("Width (m)", min_value=1e-12, value=2.0, format="%g", step=None, key="geom_width")
+                    b = st.number_input("Height (m)", min_value=1e-12, value=1.0, format="%g", step=None, key="geom_height")
+                elif cross_sec_choice == 5: # 2D Channel
+                    a = st.number_input("Channel Height (m)", min_value=1e-12, value=1.0, format="%g", step=None, key="geom_channel_height")
+                elif cross_sec_choice == 6: # Other
+                    A_in = st.number_input("Cross-sectional Area (m²)", min_value=1e-12, value=1.0, format="%g", step=None, key="geom_area")
+                    P_in = st.number_input("Wetted Perimeter (m)", min_value=1e-12, value=4.0, format="%g", step=None, key="geom_perimeter")
+                elif cross_sec_choice == 7: # Specified Dh
+                    Dh = st.number_input("Hydraulic Diameter (m)", min_value=1e-12, value=1.0, format="%g", step=None, key="geom_dh")
+                    st.info("Area is assumed based on a circular cross-section for flow rate calculations.")
+
+            with col2:
+                if is_2d_channel:
+                    U = st.number_input("Inlet Velocity (m/s)", min_value=1e-12, value=10.0, format="%g", step=None, key="flow_U_2d")
+                elif vel_type_choice == 1:
+                    U = st.number_input("Velocity (m/s)", min_value=1e-12, value=10.0, format="%g", step=None, key="flow_U")
+                elif vel_type_choice == 2:
+                    mDot = st.number_input("Mass Flow Rate (kg/s)", min_value=1e-12, value=1.0, format="%g", step=None, key="flow_mdot")
+                elif vel_type_choice == 3:
+                    QDot = st.number_input("Volume Flow Rate (m³/s)", min_value=1e-12, value=1.0, format="%g", step=None, key="flow_qdot")
+
+            if l_choice == 2 and delta_choice == "Specify a value":
+                delta_99 = st.number_input("Boundary Layer Thickness (m)", min_value=1e-12, value=0.1, format="%g", step=None, key="turb_delta")
+            elif l_choice == 3:
+                l = st.number_input("Characteristic Length (m)", min_value=1e-12, value=0.01, format="%g", step=None, key="turb_length")
+
+            submitted = st.form_submit_button("Apply inputs", type="primary")
+
+        # Derived geometry, computed from the submitted form values
+        if cross_sec_choice == 1: # Circular
+            Dh = diam
+            A = _PI_OVER_4 * diam * diam
+        elif cross_sec_choice == 2: # Annular
+            if Dout > Din:
+                Dh = Dout - Din
+                A = _PI_OVER_4 * Dh * (Dout + Din) # Difference of squares
+            else:
+                st.error("Outer diameter must be greater than inner diameter.")
+                st.stop()
+        elif cross_sec_choice == 3: # Square
+            Dh = side
+            A = side * side
+        elif cross_sec_choice == 4: # Rectangular
+            A = a * b
+            Dh = (A + A) / (a + b)
+        elif cross_sec_choice == 5: # 2D Channel
+            Dh = 2 * a
+            A = None
+        elif cross_sec_choice == 6: # Other
+            Dh = 4 * A_in / P_in
+            A = A_in
+        elif cross_sec_choice == 7: # Specified Dh
+            A = _PI_OVER_4 * Dh * Dh
+
+        if not is_2d_channel:
+            if vel_type_choice == 2:
+                U = mDot / (rho * A)
+            elif vel_type_choice == 3:
+                U = QDot / A
+
+        if l_choice == 1:
+            l = 0.07 * Dh
+        elif l_choice == 2:
+            if delta_choice == "Estimate for fully developed flow":
+                delta_99 = Dh / 2.0
+                st.write(f"Estimated δ for fully developed flow: **{delta_99:.4g} m**")
+            l = 0.4 * delta_99
+
+    # --- Case 2: External / General Flows ---
+    else:
+        st.header("3. Flow Specification")
+        st.info("For external or general cases, turbulence levels are estimated based on typical scenarios.")
+        if app_choice == 3:      # External aerodynamics
+            I, visc_rat = 0.01, 1.0
+        elif app_choice in [4, 5]: # High speed / Pumps
+            I, visc_rat = 0.1, 10.0
+        else:                     # Unsure / General
+            I, visc_rat = 0.05, 5.0
+
+        if model_choice > 1:
+            st.write("To compute Dirichlet values (k, ω, ε), a reference velocity is needed.")
+            U = st.number_input("Reference Velocity (U_ref) in m/s", min_value=1e-12, value=10.0, format="%g", step=None, key="flow_U_ref")
+
+        submitted = st.button("Calculate Turbulence Properties", type="primary")
+
+    return Dh, U, l, I, visc_rat, submitted
+
+
+# --- Results ---
+def render_results(results, model_choice, app_choice, U, Dh, l):
+    """
+    Renders the recommended boundary conditions and reference values.
+    """
+    Re, I, k = results["Re"], results["I"], results["k"]
+    omega, epsilon = results["omega"], results["epsilon"]
+    nuTilda, visc_rat = results["nuTilda"], results["visc_rat"]
+
+    # --- Display Results ---
+    st.header("Results")
+    st.success("Calculations complete. See recommended boundary conditions and reference values below.")
+
+    res_col1, res_col2 = st.columns(2)
+    with res_col1:
+        st.subheader("Recommended Boundary Conditions")
+        if model_choice == 1:
+            st.metric(label="Turbulent Viscosity Ratio (μ_t / μ)", value=f"{visc_rat:.4g}")
+            st.info("For Spalart-Allmaras, specifying the viscosity ratio is often the most robust option.")
+        elif app_choice in [1, 2]: # k-omega/eps, internal
+            st.metric(label="Turbulent Intensity (I)", value=f"{I:.4f} ({I*100:.2f} %)")
+            st.metric(label="Turbulent Length Scale (l)", value=f"{l:.4g} m")
+            st.info("For k-ε and k-ω models in internal flows, Intensity and Length Scale are robust.")
+        else: # k-omega/eps, external
+            st.metric(label="Turbulent Intensity (I)", value=f"{I:.4f} ({I*100:.2f} %)")
+            st.metric(label="Turbulent Viscosity Ratio (μ_t / μ)", value=f"{visc_rat:.4g}")
+            st.info("For k-ε and k-ω models in external flows, Intensity and Viscosity Ratio are robust.")
+
+    with res_col2:
+        st.subheader("Calculated Flow Properties")
+        if Re:
+            st.metric(label="Reynolds Number (Re)", value=f"{Re:.4g}")
+        if U:
+            st.metric(label="Bulk Velocity (U)", value=f"{U:.4g} m/s")
+        if Dh:
+            st.metric(label="Hydraulic Diameter (Dh)", value=f"{Dh:.4g} m")
+
+    with st.expander("Show Reference Dirichlet Values (for advanced use)"):
+        st.warning(
+            "**Disclaimer:** These are direct values calculated from the inputs. "
+            "It is often more stable to use the recommended conditions above if your solver supports them."
+        )
+        dir_col1, dir_col2, dir_col3 = st.columns(3)
+        with dir_col1:
+            if model_choice == 1:
+                 st.markdown(f"**S-A Variable (ν̃)**: `{nuTilda:.4g}` m²/s")
+            
+            if model_choice in [2, 3]:
+                st.markdown(f"**Turb. Kinetic Energy (k)**: `{k:.4g}` m²/s²")
+
+        with dir_col2:
+             if model_choice == 2:
+                 st.markdown(f"**Dissipation Rate (ε)**: `{epsilon:.4g}` m²/s³")
+
+        with dir_col3:
+             if model_choice == 3:
+                 st.markdown(f"**Specific Dissipation Rate (ω)**: `{omega:.4g}` 1/s")
+
+
+# --- Main App ---
+def main():
+    # --- App Configuration ---
+    st.set_page_config(
+        page_title="Turbulence Inlet Calculator",
+        page_icon="💨",
+        layout="wide",
+        initial_sidebar_state="expanded",
+    )
+
+    st.title("💨 Turbulence Inlet Conditions Calculator")
+    st.subheader("A web-based utility to calculate turbulent boundary conditions for CFD simulations.")
+    st.markdown("Born to Vijay and Gemini on 7th Sep 2025. Last updated: 7th Sep 2025.")
+    st.header("⬅️  Select your model and application type from the sidebar to begin.")
+
+    model_choice, app_choice, rho, mu = render_sidebar()
+    Dh, U, l, I, visc_rat, submitted = render_inputs(app_choice, model_choice, rho)
+
+    # --- Calculation Trigger ---
+    if submitted:
+        st.session_state["calc_ready"] = True
+
+    if submitted or st.session_state.get("calc_ready"):
+        # Perform calculations once inputs have been submitted
+        results = compute_turbulence(rho, mu, U, Dh, l, I, visc_rat, model_choice, app_choice)
+        render_results(results, model_choice, app_choice, U, Dh, l)